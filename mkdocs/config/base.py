@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import functools
 import logging
 import os
 import sys
+import weakref
 from collections import UserDict
 from contextlib import contextmanager
 from typing import (
@@ -41,15 +41,16 @@ class BaseConfigOption(Generic[T]):
 
     @property
     def default(self):
-        try:
+        if self._default_is_copyable:
             # ensure no mutable values are assigned
             return self._default.copy()
-        except AttributeError:
-            return self._default
+        return self._default
 
     @default.setter
     def default(self, value):
         self._default = value
+        # Decided once here, rather than by catching AttributeError on every read of the default.
+        self._default_is_copyable = hasattr(value, 'copy')
 
     def validate(self, value: object) -> T:
         return self.run_validation(value)
@@ -110,6 +111,9 @@ class ValidationError(Exception):
     def __eq__(self, other):
         return type(self) is type(other) and str(self) == str(other)
 
+    def __hash__(self):
+        return hash((type(self), str(self)))
+
 
 PlainConfigSchemaItem = Tuple[str, BaseConfigOption]
 PlainConfigSchema = Sequence[PlainConfigSchemaItem]
@@ -180,16 +184,17 @@ class Config(UserDict):
         failed: ConfigErrors = []
         warnings: ConfigWarnings = []
 
+        get = self.get
         for key, config_option in self._schema:
             try:
-                value = self.get(key)
-                self[key] = config_option.validate(value)
-                warnings.extend((key, w) for w in config_option.warnings)
-                config_option.reset_warnings()
+                self[key] = config_option.validate(get(key))
+                if config_option.warnings:
+                    warnings.extend((key, w) for w in config_option.warnings)
+                    config_option.reset_warnings()
             except ValidationError as e:
                 failed.append((key, e))
 
-        for key in set(self.keys()) - self._schema_keys:
+        for key in self.keys() - self._schema_keys:
             warnings.append((key, f"Unrecognised configuration name: {key}"))
 
         return failed, warnings
@@ -201,8 +206,9 @@ class Config(UserDict):
         for key, config_option in self._schema:
             try:
                 config_option.pre_validation(self, key_name=key)
-                warnings.extend((key, w) for w in config_option.warnings)
-                config_option.reset_warnings()
+                if config_option.warnings:
+                    warnings.extend((key, w) for w in config_option.warnings)
+                    config_option.reset_warnings()
             except ValidationError as e:
                 failed.append((key, e))
 
@@ -215,8 +221,9 @@ class Config(UserDict):
         for key, config_option in self._schema:
             try:
                 config_option.post_validation(self, key_name=key)
-                warnings.extend((key, w) for w in config_option.warnings)
-                config_option.reset_warnings()
+                if config_option.warnings:
+                    warnings.extend((key, w) for w in config_option.warnings)
+                    config_option.reset_warnings()
             except ValidationError as e:
                 failed.append((key, e))
 
@@ -250,7 +257,11 @@ class Config(UserDict):
             )
 
         self.user_configs.append(patch)
-        self.update(patch)
+        if type(self).__setitem__ is UserDict.__setitem__:
+            # Nothing to intercept, so skip the per-key `__setitem__` calls of `UserDict.update`.
+            self.data.update(patch)
+        else:
+            self.update(patch)
 
     def load_file(self, config_file: IO) -> None:
         """Load config options from the open file descriptor of a YAML file."""
@@ -263,14 +274,23 @@ class Config(UserDict):
             )
 
 
-@functools.lru_cache(maxsize=None)
+# Weak keys, so that schema classes defined locally (e.g. in plugins or tests) can still be collected.
+_schema_cache: weakref.WeakKeyDictionary[type, PlainConfigSchema] = weakref.WeakKeyDictionary()
+
+
 def get_schema(cls: type) -> PlainConfigSchema:
     """
     Extract ConfigOptions defined in a class (used just as a container) and put them into a schema tuple.
     """
     if issubclass(cls, Config):
         return cls._schema
-    return tuple((k, v) for k, v in cls.__dict__.items() if isinstance(v, BaseConfigOption))
+    try:
+        return _schema_cache[cls]
+    except KeyError:
+        schema = _schema_cache[cls] = tuple(
+            (k, v) for k, v in cls.__dict__.items() if isinstance(v, BaseConfigOption)
+        )
+        return schema
 
 
 class LegacyConfig(Config):
@@ -698,15 +698,19 @@ class SiteDir(Dir):
 
         # Validate that the docs_dir and site_dir don't contain the
         # other as this will lead to copying back and forth on each
-        # and eventually make a deep nested mess.
-        if (docs_dir + os.sep).startswith(site_dir.rstrip(os.sep) + os.sep):
+        # and eventually make a deep nested mess. Both paths are already absolute and normalized.
+        try:
+            common_dir = os.path.commonpath([docs_dir, site_dir])
+        except ValueError:  # e.g. on different drives
+            common_dir = None
+        if common_dir == site_dir:
             raise ValidationError(
                 f"The 'docs_dir' should not be within the 'site_dir' as this "
                 f"can mean the source files are overwritten by the output or "
                 f"it will be deleted if --clean is passed to mkdocs build. "
                 f"(site_dir: '{site_dir}', docs_dir: '{docs_dir}')"
             )
-        elif (site_dir + os.sep).startswith(docs_dir.rstrip(os.sep) + os.sep):
+        elif common_dir == docs_dir:
             raise ValidationError(
                 f"The 'site_dir' should not be within the 'docs_dir' as this "
                 f"leads to the build directory being copied into itself and "
@@ -868,21 +872,21 @@ class MarkdownExtensions(OptionallyRequired[List[str]]):
         self.configdata: Dict[str, dict] = {}
         if not isinstance(value, (list, tuple, dict)):
             raise ValidationError('Invalid Markdown Extensions configuration')
-        extensions = []
+        extensions: List[str] = []
+        append = extensions.append
         if isinstance(value, dict):
             for ext, cfg in value.items():
                 self.validate_ext_cfg(ext, cfg)
-                extensions.append(ext)
+                append(ext)
         else:
             for item in value:
-                if isinstance(item, dict):
-                    if len(item) > 1:
-                        raise ValidationError('Invalid Markdown Extensions configuration')
-                    ext, cfg = item.popitem()
+                if isinstance(item, str):
+                    append(item)
+                elif isinstance(item, dict) and len(item) == 1:
+                    # Unpack rather than `popitem()`, to leave the user's config untouched.
+                    [(ext, cfg)] = item.items()
                     self.validate_ext_cfg(ext, cfg)
-                    extensions.append(ext)
-                elif isinstance(item, str):
-                    extensions.append(item)
+                    append(ext)
                 else:
                     raise ValidationError('Invalid Markdown Extensions configuration')
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Optional, Sequence
 
 import jinja2
 from jinja2.ext import Extension, InternationalizationExtension
@@ -11,7 +12,6 @@ from mkdocs.config.base import ValidationError
 
 try:
     from babel.core import Locale, UnknownLocaleError
-    from babel.support import NullTranslations, Translations
 
     has_babel = True
 except ImportError:  # pragma: no cover
@@ -19,6 +19,19 @@ except ImportError:  # pragma: no cover
 
     has_babel = False
 
+if TYPE_CHECKING:
+    from babel.support import Translations
+
+
+def __getattr__(name: str):
+    # `babel.support` is imported lazily (see `_get_merged_translations`), but its classes remain
+    # available as attributes of this module, as they were before.
+    if has_babel and name in ('NullTranslations', 'Translations'):
+        import babel.support
+
+        return getattr(babel.support, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 log = logging.getLogger(__name__)
 base_path = os.path.dirname(os.path.abspath(__file__))
@@ -35,11 +48,18 @@ class NoBabelExtension(InternationalizationExtension):  # pragma: no cover
 
 def parse_locale(locale) -> Locale:
     try:
+        if isinstance(locale, str):
+            return _parse_locale_str(locale)
         return Locale.parse(locale, sep='_')
     except (ValueError, UnknownLocaleError, TypeError) as e:
         raise ValidationError(f'Invalid value for locale: {str(e)}')
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_locale_str(locale: str) -> Locale:
+    return Locale.parse(locale, sep='_')
+
+
 def install_translations(
     env: jinja2.Environment, locale: Locale, theme_dirs: Sequence[str]
 ) -> None:
@@ -64,6 +84,9 @@ def install_translations(
 def _get_merged_translations(
     theme_dirs: Sequence[str], locales_dir: str, locale: Locale
 ) -> Translations:
+    # Only needed when rendering, and slow to import (it pulls in `babel.dates`), so import it here.
+    from babel.support import NullTranslations, Translations
+
     merged_translations: Optional[Translations] = None
 
     log.debug(f"Looking for translations for locale '{locale}'")
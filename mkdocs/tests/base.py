@@ -85,12 +85,20 @@ def tempdir(files=None, **kw):
 
 @contextlib.contextmanager
 def change_dir(path):
-    old_cwd = os.getcwd()
-    os.chdir(path)
+    if os.chdir in os.supports_fd:
+        # Return through a descriptor of the old directory, so its path isn't resolved again.
+        old_cwd = os.open('.', os.O_RDONLY | getattr(os, 'O_PATH', 0))
+    else:  # e.g. Windows
+        old_cwd = os.getcwd()
     try:
-        yield
+        os.chdir(path)
+        try:
+            yield
+        finally:
+            os.chdir(old_cwd)
     finally:
-        os.chdir(old_cwd)
+        if isinstance(old_cwd, int):
+            os.close(old_cwd)
 
 
 class PathAssertionMixin:
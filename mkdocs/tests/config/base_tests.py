@@ -1,4 +1,8 @@
+import io
+import itertools
 import os
+import shutil
+import tempfile
 import unittest
 
 from mkdocs import exceptions
@@ -6,10 +10,37 @@ from mkdocs.config import base
 from mkdocs.config import config_options as c
 from mkdocs.config import defaults
 from mkdocs.config.base import ValidationError
-from mkdocs.tests.base import change_dir, tempdir
+from mkdocs.tests.base import change_dir
+
+
+def _fast_write(path, data: bytes):
+    # A single unbuffered write; the tests only ever write small config files.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
 
 class ConfigBaseTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One temporary root for the whole class; each test gets its own subdirectory of it.
+        cls.temp_root = tempfile.mkdtemp(prefix='mkdocs_test-')
+        cls._temp_counter = itertools.count()
+        # A real directory that config files under test can point `docs_dir` at.
+        cls.docs_dir = os.path.join(cls.temp_root, 'docs')
+        os.mkdir(cls.docs_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_root)
+
+    def make_temp_dir(self):
+        path = os.path.join(self.temp_root, f't{next(self._temp_counter)}')
+        os.mkdir(path)
+        return path
+
     def test_unrecognised_keys(self):
         conf = defaults.MkDocsConfig()
         conf.load_dict(
@@ -40,61 +71,51 @@ class ConfigBaseTests(unittest.TestCase):
         )
         self.assertEqual(warnings, [])
 
-    @tempdir()
-    def test_load_from_file(self, temp_dir):
+    def test_load_from_file(self):
         """
         Users can explicitly set the config file using the '--config' option.
         Allows users to specify a config other than the default `mkdocs.yml`.
         """
-        with open(os.path.join(temp_dir, 'mkdocs.yml'), 'w') as config_file:
-            config_file.write("site_name: MkDocs Test\n")
-        os.mkdir(os.path.join(temp_dir, 'docs'))
+        temp_dir = self.make_temp_dir()
+        config_fname = os.path.join(temp_dir, 'mkdocs.yml')
+        _fast_write(config_fname, f"site_name: MkDocs Test\ndocs_dir: {self.docs_dir}\n".encode())
 
-        cfg = base.load_config(config_file=config_file.name)
-        self.assertTrue(isinstance(cfg, defaults.MkDocsConfig))
+        cfg = base.load_config(config_file=config_fname)
+        self.assertIsInstance(cfg, defaults.MkDocsConfig)
         self.assertEqual(cfg['site_name'], 'MkDocs Test')
 
-    @tempdir()
-    def test_load_default_file(self, temp_dir):
+    def test_load_default_file(self):
         """
-        test that `mkdocs.yml` will be loaded when '--config' is not set.
+        test that `mkdocs.yml`, else `mkdocs.yaml`, will be loaded when '--config' is not set.
         """
-        with open(os.path.join(temp_dir, 'mkdocs.yml'), 'w') as config_file:
-            config_file.write("site_name: MkDocs Test\n")
-        os.mkdir(os.path.join(temp_dir, 'docs'))
+        temp_dir = self.make_temp_dir()
+        yml_path = os.path.join(temp_dir, 'mkdocs.yml')
+        yaml_path = os.path.join(temp_dir, 'mkdocs.yaml')
         with change_dir(temp_dir):
-            cfg = base.load_config(config_file=None)
-            self.assertTrue(isinstance(cfg, defaults.MkDocsConfig))
-            self.assertEqual(cfg['site_name'], 'MkDocs Test')
-
-    @tempdir
-    def test_load_default_file_with_yaml(self, temp_dir):
-        """
-        test that `mkdocs.yml` will be loaded when '--config' is not set.
-        """
-        with open(os.path.join(temp_dir, 'mkdocs.yaml'), 'w') as config_file:
-            config_file.write("site_name: MkDocs Test\n")
-        os.mkdir(os.path.join(temp_dir, 'docs'))
-        with change_dir(temp_dir):
-            cfg = base.load_config(config_file=None)
-            self.assertTrue(isinstance(cfg, defaults.MkDocsConfig))
-            self.assertEqual(cfg['site_name'], 'MkDocs Test')
-
-    @tempdir()
-    def test_load_default_file_prefer_yml(self, temp_dir):
-        """
-        test that `mkdocs.yml` will be loaded when '--config' is not set.
-        """
-        with open(os.path.join(temp_dir, 'mkdocs.yml'), 'w') as config_file1:
-            config_file1.write("site_name: MkDocs Test1\n")
-        with open(os.path.join(temp_dir, 'mkdocs.yaml'), 'w') as config_file2:
-            config_file2.write("site_name: MkDocs Test2\n")
+            with self.subTest('mkdocs.yml'):
+                _fast_write(
+                    yml_path, f"site_name: MkDocs Test1\ndocs_dir: {self.docs_dir}\n".encode()
+                )
+                cfg = base.load_config(config_file=None)
+                self.assertIsInstance(cfg, defaults.MkDocsConfig)
+                self.assertEqual(cfg['site_name'], 'MkDocs Test1')
+
+            with self.subTest('mkdocs.yaml'):
+                os.remove(yml_path)
+                _fast_write(
+                    yaml_path, f"site_name: MkDocs Test2\ndocs_dir: {self.docs_dir}\n".encode()
+                )
+                cfg = base.load_config(config_file=None)
+                self.assertIsInstance(cfg, defaults.MkDocsConfig)
+                self.assertEqual(cfg['site_name'], 'MkDocs Test2')
 
-        os.mkdir(os.path.join(temp_dir, 'docs'))
-        with change_dir(temp_dir):
-            cfg = base.load_config(config_file=None)
-            self.assertTrue(isinstance(cfg, defaults.MkDocsConfig))
-            self.assertEqual(cfg['site_name'], 'MkDocs Test1')
+            with self.subTest('prefer mkdocs.yml'):
+                _fast_write(
+                    yml_path, f"site_name: MkDocs Test1\ndocs_dir: {self.docs_dir}\n".encode()
+                )
+                cfg = base.load_config(config_file=None)
+                self.assertIsInstance(cfg, defaults.MkDocsConfig)
+                self.assertEqual(cfg['site_name'], 'MkDocs Test1')
 
     def test_load_from_missing_file(self):
         with self.assertRaisesRegex(
@@ -102,54 +123,59 @@ class ConfigBaseTests(unittest.TestCase):
         ):
             base.load_config(config_file='missing_file.yml')
 
-    @tempdir()
-    def test_load_from_open_file(self, temp_path):
+    def test_load_from_open_file(self):
         """
         `load_config` can accept an open file descriptor.
         """
+        temp_path = self.make_temp_dir()
         config_fname = os.path.join(temp_path, 'mkdocs.yml')
         config_file = open(config_fname, 'w+')
-        config_file.write("site_name: MkDocs Test\n")
+        config_file.write(f"site_name: MkDocs Test\ndocs_dir: {self.docs_dir}\n")
         config_file.flush()
-        os.mkdir(os.path.join(temp_path, 'docs'))
 
         cfg = base.load_config(config_file=config_file)
-        self.assertTrue(isinstance(cfg, defaults.MkDocsConfig))
+        self.assertIsInstance(cfg, defaults.MkDocsConfig)
         self.assertEqual(cfg['site_name'], 'MkDocs Test')
         # load_config will always close the file
         self.assertTrue(config_file.closed)
 
-    @tempdir()
-    def test_load_from_closed_file(self, temp_dir):
+    def test_load_from_closed_file(self):
         """
         The `serve` command with auto-reload may pass in a closed file descriptor.
         Ensure `load_config` reloads the closed file.
         """
+        temp_dir = self.make_temp_dir()
         with open(os.path.join(temp_dir, 'mkdocs.yml'), 'w') as config_file:
-            config_file.write("site_name: MkDocs Test\n")
-        os.mkdir(os.path.join(temp_dir, 'docs'))
+            config_file.write(f"site_name: MkDocs Test\ndocs_dir: {self.docs_dir}\n")
 
         cfg = base.load_config(config_file=config_file)
-        self.assertTrue(isinstance(cfg, defaults.MkDocsConfig))
+        self.assertIsInstance(cfg, defaults.MkDocsConfig)
         self.assertEqual(cfg['site_name'], 'MkDocs Test')
 
-    @tempdir
-    def test_load_missing_required(self, temp_dir):
+    def test_load_missing_required(self):
         """
         `site_name` is a required setting.
         """
-        with open(os.path.join(temp_dir, 'mkdocs.yml'), 'w') as config_file:
-            config_file.write("site_dir: output\nsite_url: https://www.mkdocs.org\n")
-        os.mkdir(os.path.join(temp_dir, 'docs'))
+        config_file = io.StringIO(
+            f"site_dir: output\nsite_url: https://www.mkdocs.org\ndocs_dir: {self.docs_dir}\n"
+        )
 
         with self.assertLogs('mkdocs') as cm:
             with self.assertRaises(exceptions.Abort):
-                base.load_config(config_file=config_file.name)
+                base.load_config(config_file=config_file)
         self.assertEqual(
             '\n'.join(cm.output),
             "ERROR:mkdocs.config:Config value 'site_name': Required configuration not provided.",
         )
 
+    def test_validation_error_hash(self):
+        self.assertEqual(hash(ValidationError('foo')), hash(ValidationError('foo')))
+        self.assertEqual(
+            {ValidationError('foo'), ValidationError('foo'), ValidationError('bar')},
+            {ValidationError('foo'), ValidationError('bar')},
+        )
+        self.assertEqual(len({ValidationError('foo'), ValidationError('foo')}), 1)
+
     def test_pre_validation_error(self):
         class InvalidConfigOption(c.BaseConfigOption):
             def pre_validation(self, config, key_name):
@@ -251,20 +277,19 @@ class ConfigBaseTests(unittest.TestCase):
             ],
         )
 
-    @tempdir()
-    def test_load_from_file_with_relative_paths(self, config_dir):
+    def test_load_from_file_with_relative_paths(self):
         """
         When explicitly setting a config file, paths should be relative to the
         config file, not the working directory.
         """
+        config_dir = self.make_temp_dir()
         config_fname = os.path.join(config_dir, 'mkdocs.yml')
-        with open(config_fname, 'w') as config_file:
-            config_file.write("docs_dir: src\nsite_name: MkDocs Test\n")
+        _fast_write(config_fname, b"docs_dir: src\nsite_name: MkDocs Test\n")
         docs_dir = os.path.join(config_dir, 'src')
         os.mkdir(docs_dir)
 
-        cfg = base.load_config(config_file=config_file)
-        self.assertTrue(isinstance(cfg, defaults.MkDocsConfig))
+        cfg = base.load_config(config_file=config_fname)
+        self.assertIsInstance(cfg, defaults.MkDocsConfig)
         self.assertEqual(cfg['site_name'], 'MkDocs Test')
         self.assertEqual(cfg['docs_dir'], docs_dir)
         self.assertEqual(cfg.config_file_path, config_fname)
@@ -275,6 +300,7 @@ class ConfigBaseTests(unittest.TestCase):
             z = c.URL()
             aa = c.Type(int)
 
+        attrs = set(vars(FooConfig))
         self.assertEqual(
             base.get_schema(FooConfig),
             (
@@ -282,3 +308,6 @@ class ConfigBaseTests(unittest.TestCase):
                 ('aa', FooConfig.aa),
             ),
         )
+        # The result is memoized without touching the class.
+        self.assertIs(base.get_schema(FooConfig), base.get_schema(FooConfig))
+        self.assertEqual(set(vars(FooConfig)), attrs)
@@ -1,12 +1,11 @@
 import contextlib
 import copy
-import io
 import os
 import re
 import sys
 import textwrap
 import unittest
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from unittest.mock import patch
 
 import mkdocs
@@ -17,7 +16,12 @@ from mkdocs.utils import write_file, yaml_load
 
 
 class UnexpectedError(Exception):
-    pass
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = [(key, str(msg)) for key, msg in errors]
+
+    def __str__(self):
+        return ', '.join(f'{key}="{msg}"' for key, msg in self.errors)
 
 
 class TestCase(unittest.TestCase):
@@ -26,24 +30,30 @@ class TestCase(unittest.TestCase):
         [(key, msg)] = kwargs.items()
         with self.assertRaises(UnexpectedError) as cm:
             yield
+        errors = cm.exception.errors
         if isinstance(msg, re.Pattern):
-            self.assertRegex(str(cm.exception), f'^{key}="{msg.pattern}"$')
+            self.assertEqual([key], [k for k, _ in errors], msg=str(cm.exception))
+            actual_msg = errors[0][1]
+            self.assertTrue(
+                msg.fullmatch(actual_msg), f'{actual_msg!r} does not match {msg.pattern!r}'
+            )
         else:
-            self.assertEqual(f'{key}="{msg}"', str(cm.exception))
+            self.assertEqual([(key, msg)], errors)
 
     def get_config(
         self,
         schema: type,
         cfg: Dict[str, Any],
-        warnings: Dict[str, str] = {},
+        warnings: Optional[Dict[str, str]] = None,
         config_file_path=None,
     ):
         config = base.LegacyConfig(base.get_schema(schema), config_file_path=config_file_path)
         config.load_dict(cfg)
         actual_errors, actual_warnings = config.validate()
         if actual_errors:
-            raise UnexpectedError(', '.join(f'{key}="{msg}"' for key, msg in actual_errors))
-        self.assertEqual(warnings, dict(actual_warnings))
+            raise UnexpectedError(actual_errors)
+        if warnings or actual_warnings:
+            self.assertEqual(sorted((warnings or {}).items()), sorted(actual_warnings))
         return config
 
 
@@ -172,15 +182,18 @@ class ChoiceTest(TestCase):
             self.get_config(Schema, {'option': 'go'})
 
     def test_invalid_choices(self):
-        with self.assertRaises(ValueError):
-            c.Choice('')
-        with self.assertRaises(ValueError):
-            c.Choice([])
-        with self.assertRaises(ValueError):
-            c.Choice(5)
+        for choices in '', [], 5:
+            with self.subTest(choices):
+                with self.assertRaises(ValueError):
+                    c.Choice(choices)
 
 
 class DeprecatedTest(TestCase):
+    DEPRECATED = (
+        "The configuration option {!r} has been deprecated and will be removed in a future release."
+    )
+    MOVED = DEPRECATED + " Use {!r} instead."
+
     def test_deprecated_option_simple(self):
         class Schema:
             d = c.Deprecated()
@@ -188,10 +201,7 @@ class DeprecatedTest(TestCase):
         self.get_config(
             Schema,
             {'d': 'value'},
-            warnings=dict(
-                d="The configuration option 'd' has been deprecated and will be removed in a "
-                "future release."
-            ),
+            warnings={'d': self.DEPRECATED.format('d')},
         )
 
     def test_deprecated_option_message(self):
@@ -207,10 +217,7 @@ class DeprecatedTest(TestCase):
         self.get_config(
             Schema,
             {'d': 'value'},
-            warnings=dict(
-                d="The configuration option 'd' has been deprecated and will be removed in a "
-                "future release."
-            ),
+            warnings={'d': self.DEPRECATED.format('d')},
         )
 
     def test_deprecated_option_with_invalid_type(self):
@@ -221,10 +228,7 @@ class DeprecatedTest(TestCase):
             self.get_config(
                 Schema,
                 {'d': 'value'},
-                warnings=dict(
-                    d="The configuration option 'd' has been deprecated and will be removed in a "
-                    "future release."
-                ),
+                warnings={'d': self.DEPRECATED.format('d')},
             )
 
     def test_removed_option(self):
@@ -250,10 +254,7 @@ class DeprecatedTest(TestCase):
         conf = self.get_config(
             Schema,
             {'old': 'value'},
-            warnings=dict(
-                old="The configuration option 'old' has been deprecated and will be removed in a "
-                "future release. Use 'new' instead."
-            ),
+            warnings={'old': self.MOVED.format('old', 'new')},
         )
         self.assertEqual(conf, {'new': 'value', 'old': None})
 
@@ -265,10 +266,7 @@ class DeprecatedTest(TestCase):
         conf = self.get_config(
             Schema,
             {'old': 'value'},
-            warnings=dict(
-                old="The configuration option 'old' has been deprecated and will be removed in a "
-                "future release. Use 'foo.bar' instead."
-            ),
+            warnings={'old': self.MOVED.format('old', 'foo.bar')},
         )
         self.assertEqual(conf, {'foo': {'bar': 'value'}, 'old': None})
 
@@ -280,10 +278,7 @@ class DeprecatedTest(TestCase):
         conf = self.get_config(
             Schema,
             {'old': 'value', 'foo': {'existing': 'existing'}},
-            warnings=dict(
-                old="The configuration option 'old' has been deprecated and will be removed in a "
-                "future release. Use 'foo.bar' instead."
-            ),
+            warnings={'old': self.MOVED.format('old', 'foo.bar')},
         )
         self.assertEqual(conf, {'foo': {'existing': 'existing', 'bar': 'value'}, 'old': None})
 
@@ -296,10 +291,7 @@ class DeprecatedTest(TestCase):
             self.get_config(
                 Schema,
                 {'old': 'value', 'foo': 'wrong type'},
-                warnings=dict(
-                    old="The configuration option 'old' has been deprecated and will be removed in a "
-                    "future release. Use 'foo.bar' instead."
-                ),
+                warnings={'old': self.MOVED.format('old', 'foo.bar')},
             )
 
 
@@ -386,13 +378,13 @@ class IpAddressTest(TestCase):
         self.get_config(
             Schema,
             {'dev_addr': '0.0.0.0:8000'},
-            warnings=dict(
-                dev_addr="The use of the IP address '0.0.0.0' suggests a production "
+            warnings={
+                'dev_addr': "The use of the IP address '0.0.0.0' suggests a production "
                 "environment or the use of a proxy to connect to the MkDocs "
                 "server. However, the MkDocs' server is intended for local "
                 "development purposes only. Please use a third party "
                 "production-ready server instead."
-            ),
+            },
         )
 
     def test_unsupported_IPv6_address(self):
@@ -402,12 +394,12 @@ class IpAddressTest(TestCase):
         self.get_config(
             Schema,
             {'dev_addr': ':::8000'},
-            warnings=dict(
-                dev_addr="The use of the IP address '::' suggests a production environment "
+            warnings={
+                'dev_addr': "The use of the IP address '::' suggests a production environment "
                 "or the use of a proxy to connect to the MkDocs server. However, "
                 "the MkDocs' server is intended for local development purposes "
                 "only. Please use a third party production-ready server instead."
-            ),
+            },
         )
 
 
@@ -585,9 +577,9 @@ class EditURITest(TestCase):
                 'edit_uri': 'edit',
                 'edit_uri_template': 'edit/master/{path}',
             },
-            warnings=dict(
-                edit_uri_template="The option 'edit_uri' has no effect when 'edit_uri_template' is set."
-            ),
+            warnings={
+                'edit_uri_template': "The option 'edit_uri' has no effect when 'edit_uri_template' is set."
+            },
         )
         self.assertEqual(conf['edit_uri_template'], 'edit/master/{path}')
 
@@ -657,9 +649,9 @@ class ListOfItemsTest(TestCase):
 
 class FilesystemObjectTest(TestCase):
     def test_valid_dir(self):
+        d = os.path.dirname(__file__)
         for cls in c.Dir, c.FilesystemObject:
             with self.subTest(cls):
-                d = os.path.dirname(__file__)
 
                 class Schema:
                     option = cls(exists=True)
@@ -668,9 +660,9 @@ class FilesystemObjectTest(TestCase):
                 self.assertEqual(conf['option'], d)
 
     def test_valid_file(self):
+        f = __file__
         for cls in c.File, c.FilesystemObject:
             with self.subTest(cls):
-                f = __file__
 
                 class Schema:
                     option = cls(exists=True)
@@ -679,9 +671,9 @@ class FilesystemObjectTest(TestCase):
                 self.assertEqual(conf['option'], f)
 
     def test_missing_without_exists(self):
+        d = os.path.join("not", "a", "real", "path", "I", "hope")
         for cls in c.Dir, c.File, c.FilesystemObject:
             with self.subTest(cls):
-                d = os.path.join("not", "a", "real", "path", "I", "hope")
 
                 class Schema:
                     option = cls()
@@ -690,14 +682,15 @@ class FilesystemObjectTest(TestCase):
                 self.assertEqual(conf['option'], os.path.abspath(d))
 
     def test_missing_but_required(self):
+        d = os.path.join("not", "a", "real", "path", "I", "hope")
+        error = re.compile(r"The path '.+' isn't an existing .+")
         for cls in c.Dir, c.File, c.FilesystemObject:
             with self.subTest(cls):
-                d = os.path.join("not", "a", "real", "path", "I", "hope")
 
                 class Schema:
                     option = cls(exists=True)
 
-                with self.expect_error(option=re.compile(r"The path '.+' isn't an existing .+")):
+                with self.expect_error(option=error):
                     self.get_config(Schema, {'option': d})
 
     def test_not_a_dir(self):
@@ -752,9 +745,9 @@ class FilesystemObjectTest(TestCase):
             self.get_config(Schema, {'dir': b'foo'})
 
     def test_config_dir_prepended(self):
+        base_path = os.path.dirname(os.path.abspath(__file__))
         for cls in c.Dir, c.File, c.FilesystemObject:
             with self.subTest(cls):
-                base_path = os.path.dirname(os.path.abspath(__file__))
 
                 class Schema:
                     dir = cls()
@@ -854,6 +847,9 @@ class ListOfPathsTest(TestCase):
 
 
 class SiteDirTest(TestCase):
+    DOCS_DIR_IN_SITE_DIR = re.compile(r"The 'docs_dir' should not be within the 'site_dir'.*")
+    SITE_DIR_IN_DOCS_DIR = re.compile(r"The 'site_dir' should not be within the 'docs_dir'.*")
+
     class Schema:
         site_dir = c.SiteDir()
         docs_dir = c.Dir()
@@ -875,9 +871,7 @@ class SiteDirTest(TestCase):
 
         for test_config in test_configs:
             with self.subTest(test_config):
-                with self.expect_error(
-                    site_dir=re.compile(r"The 'docs_dir' should not be within the 'site_dir'.*")
-                ):
+                with self.expect_error(site_dir=self.DOCS_DIR_IN_SITE_DIR):
                     self.get_config(self.Schema, test_config)
 
     def test_site_dir_in_docs_dir(self):
@@ -892,9 +886,7 @@ class SiteDirTest(TestCase):
 
         for test_config in test_configs:
             with self.subTest(test_config):
-                with self.expect_error(
-                    site_dir=re.compile(r"The 'site_dir' should not be within the 'docs_dir'.*")
-                ):
+                with self.expect_error(site_dir=self.SITE_DIR_IN_DOCS_DIR):
                     self.get_config(self.Schema, test_config)
 
     def test_common_prefix(self):
@@ -911,6 +903,10 @@ class SiteDirTest(TestCase):
 
 
 class ThemeTest(TestCase):
+    UNRECOGNISED_THEME = re.compile(
+        r"Unrecognised theme name: 'mkdocs2'\. The available installed themes are: .+"
+    )
+
     def test_theme_as_string(self):
         class Schema:
             option = c.Theme()
@@ -922,11 +918,7 @@ class ThemeTest(TestCase):
         class Schema:
             option = c.Theme()
 
-        with self.expect_error(
-            option=re.compile(
-                r"Unrecognised theme name: 'mkdocs2'. The available installed themes are: .+"
-            )
-        ):
+        with self.expect_error(option=self.UNRECOGNISED_THEME):
             self.get_config(Schema, {'option': "mkdocs2"})
 
     def test_theme_default(self):
@@ -998,11 +990,7 @@ class ThemeTest(TestCase):
         class Schema:
             option = c.Theme()
 
-        with self.expect_error(
-            option=re.compile(
-                r"Unrecognised theme name: 'mkdocs2'. The available installed themes are: .+"
-            )
-        ):
+        with self.expect_error(option=self.UNRECOGNISED_THEME):
             self.get_config(Schema, {'option': config})
 
     def test_theme_invalid_type(self):
@@ -1116,7 +1104,7 @@ class NavTest(TestCase):
                 - Installation: user-guide/installation.md
             '''
         )
-        nav = yaml_load(io.StringIO(nav_yaml))
+        nav = yaml_load(nav_yaml)
 
         conf = self.get_config(self.Schema, {'option': nav})
         self.assertEqual(conf['option'], nav)
@@ -1164,11 +1152,16 @@ class NavTest(TestCase):
         ):
             self.get_config(self.Schema, {'option': nav})
 
+    def test_invalid_items_reported_in_order(self):
+        nav = [{'aaa': ['bbb.md', 1]}, None]
+        with self.expect_error(option="Expected nav item to be a string or dict, got a int: 1"):
+            self.get_config(self.Schema, {'option': nav})
+
     def test_warns_for_dict(self):
         self.get_config(
             self.Schema,
             {'option': [{"a": {"b": "c.md", "d": "e.md"}}]},
-            warnings=dict(option="Expected nav to be a list, got dict with keys ('b', 'd')"),
+            warnings={'option': "Expected nav to be a list, got dict with keys ('b', 'd')"},
         )
 
 
@@ -1235,7 +1228,7 @@ class SubConfigTest(TestCase):
         conf = self.get_config(
             Schema,
             {'option': {'unknown': 0}},
-            warnings=dict(option="Sub-option 'unknown': Unrecognised configuration name: unknown"),
+            warnings={'option': "Sub-option 'unknown': Unrecognised configuration name: unknown"},
         )
         self.assertEqual(conf['option'], {"unknown": 0})
 
@@ -1347,8 +1340,17 @@ class ConfigItemsTest(TestCase):
 
 
 class MarkdownExtensionsTest(TestCase):
-    @patch('markdown.Markdown')
-    def test_simple_list(self, mock_md):
+    # The extension names used here don't exist, so don't let Markdown try to load them.
+    @classmethod
+    def setUpClass(cls):
+        cls._md_patcher = patch('markdown.Markdown')
+        cls._md_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._md_patcher.stop()
+
+    def test_simple_list(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions()
             mdx_configs = c.Private()
@@ -1360,8 +1362,7 @@ class MarkdownExtensionsTest(TestCase):
         self.assertEqual(conf['markdown_extensions'], ['foo', 'bar'])
         self.assertEqual(conf['mdx_configs'], {})
 
-    @patch('markdown.Markdown')
-    def test_list_dicts(self, mock_md):
+    def test_list_dicts(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions()
             mdx_configs = c.Private()
@@ -1383,8 +1384,7 @@ class MarkdownExtensionsTest(TestCase):
             },
         )
 
-    @patch('markdown.Markdown')
-    def test_mixed_list(self, mock_md):
+    def test_mixed_list(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions()
             mdx_configs = c.Private()
@@ -1403,9 +1403,10 @@ class MarkdownExtensionsTest(TestCase):
                 'bar': {'bar_option': 'bar value'},
             },
         )
+        # The user's config is left as it was.
+        self.assertEqual(config['markdown_extensions'][1], {'bar': {'bar_option': 'bar value'}})
 
-    @patch('markdown.Markdown')
-    def test_dict_of_dicts(self, mock_md):
+    def test_dict_of_dicts(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions()
             mdx_configs = c.Private()
@@ -1427,8 +1428,7 @@ class MarkdownExtensionsTest(TestCase):
             },
         )
 
-    @patch('markdown.Markdown')
-    def test_builtins(self, mock_md):
+    def test_builtins(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
             mdx_configs = c.Private()
@@ -1440,34 +1440,7 @@ class MarkdownExtensionsTest(TestCase):
         self.assertEqual(conf['markdown_extensions'], ['meta', 'toc', 'foo', 'bar'])
         self.assertEqual(conf['mdx_configs'], {})
 
-    def test_duplicates(self):
-        class Schema:
-            markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
-            mdx_configs = c.Private()
-
-        config = {
-            'markdown_extensions': ['meta', 'toc'],
-        }
-        conf = self.get_config(Schema, config)
-        self.assertEqual(conf['markdown_extensions'], ['meta', 'toc'])
-        self.assertEqual(conf['mdx_configs'], {})
-
-    def test_builtins_config(self):
-        class Schema:
-            markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
-            mdx_configs = c.Private()
-
-        config = {
-            'markdown_extensions': [
-                {'toc': {'permalink': True}},
-            ],
-        }
-        conf = self.get_config(Schema, config)
-        self.assertEqual(conf['markdown_extensions'], ['meta', 'toc'])
-        self.assertEqual(conf['mdx_configs'], {'toc': {'permalink': True}})
-
-    @patch('markdown.Markdown')
-    def test_configkey(self, mock_md):
+    def test_configkey(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions(configkey='bar')
             bar = c.Private()
@@ -1486,37 +1459,14 @@ class MarkdownExtensionsTest(TestCase):
             },
         )
 
-    def test_missing_default(self):
-        class Schema:
-            markdown_extensions = c.MarkdownExtensions()
-            mdx_configs = c.Private()
-
-        conf = self.get_config(Schema, {})
-        self.assertEqual(conf['markdown_extensions'], [])
-        self.assertEqual(conf['mdx_configs'], {})
-
-    def test_none(self):
-        class Schema:
-            markdown_extensions = c.MarkdownExtensions(default=[])
-            mdx_configs = c.Private()
-
-        config = {
-            'markdown_extensions': None,
-        }
-        conf = self.get_config(Schema, config)
-        self.assertEqual(conf['markdown_extensions'], [])
-        self.assertEqual(conf['mdx_configs'], {})
-
-    @patch('markdown.Markdown')
-    def test_not_list(self, mock_md):
+    def test_not_list(self):
         class Schema:
             option = c.MarkdownExtensions()
 
         with self.expect_error(option="Invalid Markdown Extensions configuration"):
             self.get_config(Schema, {'option': 'not a list'})
 
-    @patch('markdown.Markdown')
-    def test_invalid_config_option(self, mock_md):
+    def test_invalid_config_option(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions()
 
@@ -1530,8 +1480,7 @@ class MarkdownExtensionsTest(TestCase):
         ):
             self.get_config(Schema, config)
 
-    @patch('markdown.Markdown')
-    def test_invalid_config_item(self, mock_md):
+    def test_invalid_config_item(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions()
 
@@ -1543,8 +1492,7 @@ class MarkdownExtensionsTest(TestCase):
         with self.expect_error(markdown_extensions="Invalid Markdown Extensions configuration"):
             self.get_config(Schema, config)
 
-    @patch('markdown.Markdown')
-    def test_invalid_dict_item(self, mock_md):
+    def test_invalid_dict_item(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions()
 
@@ -1556,6 +1504,62 @@ class MarkdownExtensionsTest(TestCase):
         with self.expect_error(markdown_extensions="Invalid Markdown Extensions configuration"):
             self.get_config(Schema, config)
 
+    def test_empty_dict_item(self):
+        class Schema:
+            markdown_extensions = c.MarkdownExtensions()
+
+        with self.expect_error(markdown_extensions="Invalid Markdown Extensions configuration"):
+            self.get_config(Schema, {'markdown_extensions': [{}]})
+
+
+class MarkdownExtensionsLoadingTest(TestCase):
+    def test_duplicates(self):
+        class Schema:
+            markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
+            mdx_configs = c.Private()
+
+        config = {
+            'markdown_extensions': ['meta', 'toc'],
+        }
+        conf = self.get_config(Schema, config)
+        self.assertEqual(conf['markdown_extensions'], ['meta', 'toc'])
+        self.assertEqual(conf['mdx_configs'], {})
+
+    def test_builtins_config(self):
+        class Schema:
+            markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
+            mdx_configs = c.Private()
+
+        config = {
+            'markdown_extensions': [
+                {'toc': {'permalink': True}},
+            ],
+        }
+        conf = self.get_config(Schema, config)
+        self.assertEqual(conf['markdown_extensions'], ['meta', 'toc'])
+        self.assertEqual(conf['mdx_configs'], {'toc': {'permalink': True}})
+
+    def test_missing_default(self):
+        class Schema:
+            markdown_extensions = c.MarkdownExtensions()
+            mdx_configs = c.Private()
+
+        conf = self.get_config(Schema, {})
+        self.assertEqual(conf['markdown_extensions'], [])
+        self.assertEqual(conf['mdx_configs'], {})
+
+    def test_none(self):
+        class Schema:
+            markdown_extensions = c.MarkdownExtensions(default=[])
+            mdx_configs = c.Private()
+
+        config = {
+            'markdown_extensions': None,
+        }
+        conf = self.get_config(Schema, config)
+        self.assertEqual(conf['markdown_extensions'], [])
+        self.assertEqual(conf['mdx_configs'], {})
+
     def test_unknown_extension(self):
         class Schema:
             markdown_extensions = c.MarkdownExtensions()
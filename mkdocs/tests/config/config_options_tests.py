@@ -1,6 +1,5 @@
 import contextlib
 import copy
-import io
 import os
 import re
 import sys
@@ -29,7 +28,12 @@ SomeConfig = TypeVar('SomeConfig', bound=Config)
 
 
 class UnexpectedError(Exception):
-    pass
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = [(key, str(msg)) for key, msg in errors]
+
+    def __str__(self):
+        return ', '.join(f'{key}="{msg}"' for key, msg in self.errors)
 
 
 class TestCase(unittest.TestCase):
@@ -38,24 +42,30 @@ class TestCase(unittest.TestCase):
         [(key, msg)] = kwargs.items()
         with self.assertRaises(UnexpectedError) as cm:
             yield
+        errors = cm.exception.errors
         if isinstance(msg, re.Pattern):
-            self.assertRegex(str(cm.exception), f'^{key}="{msg.pattern}"$')
+            self.assertEqual([key], [k for k, _ in errors], msg=str(cm.exception))
+            actual_msg = errors[0][1]
+            self.assertTrue(
+                msg.fullmatch(actual_msg), f'{actual_msg!r} does not match {msg.pattern!r}'
+            )
         else:
-            self.assertEqual(f'{key}="{msg}"', str(cm.exception))
+            self.assertEqual([(key, msg)], errors)
 
     def get_config(
         self,
         config_class: Type[SomeConfig],
         cfg: Dict[str, Any],
-        warnings: Dict[str, str] = {},
+        warnings: Optional[Dict[str, str]] = None,
         config_file_path=None,
     ) -> SomeConfig:
         config = config_class(config_file_path=config_file_path)
         config.load_dict(cfg)
         actual_errors, actual_warnings = config.validate()
         if actual_errors:
-            raise UnexpectedError(', '.join(f'{key}="{msg}"' for key, msg in actual_errors))
-        self.assertEqual(warnings, dict(actual_warnings))
+            raise UnexpectedError(actual_errors)
+        if warnings or actual_warnings:
+            self.assertEqual(sorted((warnings or {}).items()), sorted(actual_warnings))
         return config
 
 
@@ -888,6 +898,9 @@ class ListOfPathsTest(TestCase):
 
 
 class SiteDirTest(TestCase):
+    DOCS_DIR_IN_SITE_DIR = re.compile(r"The 'docs_dir' should not be within the 'site_dir'.*")
+    SITE_DIR_IN_DOCS_DIR = re.compile(r"The 'site_dir' should not be within the 'docs_dir'.*")
+
     class Schema(Config):
         site_dir = c.SiteDir()
         docs_dir = c.Dir()
@@ -909,9 +922,7 @@ class SiteDirTest(TestCase):
 
         for test_config in test_configs:
             with self.subTest(test_config):
-                with self.expect_error(
-                    site_dir=re.compile(r"The 'docs_dir' should not be within the 'site_dir'.*")
-                ):
+                with self.expect_error(site_dir=self.DOCS_DIR_IN_SITE_DIR):
                     self.get_config(self.Schema, test_config)
 
     def test_site_dir_in_docs_dir(self) -> None:
@@ -926,9 +937,7 @@ class SiteDirTest(TestCase):
 
         for test_config in test_configs:
             with self.subTest(test_config):
-                with self.expect_error(
-                    site_dir=re.compile(r"The 'site_dir' should not be within the 'docs_dir'.*")
-                ):
+                with self.expect_error(site_dir=self.SITE_DIR_IN_DOCS_DIR):
                     self.get_config(self.Schema, test_config)
 
     def test_common_prefix(self) -> None:
@@ -945,6 +954,10 @@ class SiteDirTest(TestCase):
 
 
 class ThemeTest(TestCase):
+    UNRECOGNISED_THEME = re.compile(
+        r"Unrecognised theme name: 'mkdocs2'\. The available installed themes are: .+"
+    )
+
     def test_theme_as_string(self) -> None:
         class Schema(Config):
             option = c.Theme()
@@ -958,11 +971,7 @@ class ThemeTest(TestCase):
         class Schema(Config):
             option = c.Theme()
 
-        with self.expect_error(
-            option=re.compile(
-                r"Unrecognised theme name: 'mkdocs2'. The available installed themes are: .+"
-            )
-        ):
+        with self.expect_error(option=self.UNRECOGNISED_THEME):
             self.get_config(Schema, {'option': "mkdocs2"})
 
     def test_theme_default(self) -> None:
@@ -1034,11 +1043,7 @@ class ThemeTest(TestCase):
         class Schema(Config):
             option = c.Theme()
 
-        with self.expect_error(
-            option=re.compile(
-                r"Unrecognised theme name: 'mkdocs2'. The available installed themes are: .+"
-            )
-        ):
+        with self.expect_error(option=self.UNRECOGNISED_THEME):
             self.get_config(Schema, {'option': config})
 
     def test_theme_invalid_type(self) -> None:
@@ -1152,7 +1157,7 @@ class NavTest(TestCase):
                 - Installation: user-guide/installation.md
             '''
         )
-        nav = yaml_load(io.StringIO(nav_yaml))
+        nav = yaml_load(nav_yaml)
 
         conf = self.get_config(self.Schema, {'option': nav})
         self.assertEqual(conf.option, nav)
@@ -1200,6 +1205,11 @@ class NavTest(TestCase):
         ):
             self.get_config(self.Schema, {'option': nav})
 
+    def test_invalid_items_reported_in_order(self) -> None:
+        nav = [{'aaa': ['bbb.md', 1]}, None]
+        with self.expect_error(option="Expected nav item to be a string or dict, got a int: 1"):
+            self.get_config(self.Schema, {'option': nav})
+
     def test_warns_for_dict(self) -> None:
         self.get_config(
             self.Schema,
@@ -1374,8 +1384,17 @@ class SubConfigTest(TestCase):
 
 
 class MarkdownExtensionsTest(TestCase):
-    @patch('markdown.Markdown')
-    def test_simple_list(self, mock_md) -> None:
+    # The extension names used here don't exist, so don't let Markdown try to load them.
+    @classmethod
+    def setUpClass(cls):
+        cls._md_patcher = patch('markdown.Markdown')
+        cls._md_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._md_patcher.stop()
+
+    def test_simple_list(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions()
             mdx_configs = c.Private()
@@ -1388,8 +1407,7 @@ class MarkdownExtensionsTest(TestCase):
         self.assertEqual(conf.markdown_extensions, ['foo', 'bar'])
         self.assertEqual(conf.mdx_configs, {})
 
-    @patch('markdown.Markdown')
-    def test_list_dicts(self, mock_md) -> None:
+    def test_list_dicts(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions()
             mdx_configs = c.Private()
@@ -1411,8 +1429,7 @@ class MarkdownExtensionsTest(TestCase):
             },
         )
 
-    @patch('markdown.Markdown')
-    def test_mixed_list(self, mock_md) -> None:
+    def test_mixed_list(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions()
             mdx_configs = c.Private()
@@ -1431,9 +1448,10 @@ class MarkdownExtensionsTest(TestCase):
                 'bar': {'bar_option': 'bar value'},
             },
         )
+        # The user's config is left as it was.
+        self.assertEqual(config['markdown_extensions'][1], {'bar': {'bar_option': 'bar value'}})
 
-    @patch('markdown.Markdown')
-    def test_dict_of_dicts(self, mock_md) -> None:
+    def test_dict_of_dicts(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions()
             mdx_configs = c.Private()
@@ -1455,8 +1473,7 @@ class MarkdownExtensionsTest(TestCase):
             },
         )
 
-    @patch('markdown.Markdown')
-    def test_builtins(self, mock_md) -> None:
+    def test_builtins(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
             mdx_configs = c.Private()
@@ -1468,34 +1485,7 @@ class MarkdownExtensionsTest(TestCase):
         self.assertEqual(conf.markdown_extensions, ['meta', 'toc', 'foo', 'bar'])
         self.assertEqual(conf.mdx_configs, {})
 
-    def test_duplicates(self) -> None:
-        class Schema(Config):
-            markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
-            mdx_configs = c.Private()
-
-        config = {
-            'markdown_extensions': ['meta', 'toc'],
-        }
-        conf = self.get_config(Schema, config)
-        self.assertEqual(conf.markdown_extensions, ['meta', 'toc'])
-        self.assertEqual(conf.mdx_configs, {})
-
-    def test_builtins_config(self) -> None:
-        class Schema(Config):
-            markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
-            mdx_configs = c.Private()
-
-        config = {
-            'markdown_extensions': [
-                {'toc': {'permalink': True}},
-            ],
-        }
-        conf = self.get_config(Schema, config)
-        self.assertEqual(conf.markdown_extensions, ['meta', 'toc'])
-        self.assertEqual(conf.mdx_configs, {'toc': {'permalink': True}})
-
-    @patch('markdown.Markdown')
-    def test_configkey(self, mock_md) -> None:
+    def test_configkey(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions(configkey='bar')
             bar = c.Private()
@@ -1514,37 +1504,14 @@ class MarkdownExtensionsTest(TestCase):
             },
         )
 
-    def test_missing_default(self) -> None:
-        class Schema(Config):
-            markdown_extensions = c.MarkdownExtensions()
-            mdx_configs = c.Private()
-
-        conf = self.get_config(Schema, {})
-        self.assertEqual(conf.markdown_extensions, [])
-        self.assertEqual(conf.mdx_configs, {})
-
-    def test_none(self) -> None:
-        class Schema(Config):
-            markdown_extensions = c.MarkdownExtensions(default=[])
-            mdx_configs = c.Private()
-
-        config = {
-            'markdown_extensions': None,
-        }
-        conf = self.get_config(Schema, config)
-        self.assertEqual(conf.markdown_extensions, [])
-        self.assertEqual(conf.mdx_configs, {})
-
-    @patch('markdown.Markdown')
-    def test_not_list(self, mock_md) -> None:
+    def test_not_list(self) -> None:
         class Schema(Config):
             option = c.MarkdownExtensions()
 
         with self.expect_error(option="Invalid Markdown Extensions configuration"):
             self.get_config(Schema, {'option': 'not a list'})
 
-    @patch('markdown.Markdown')
-    def test_invalid_config_option(self, mock_md) -> None:
+    def test_invalid_config_option(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions()
 
@@ -1558,8 +1525,7 @@ class MarkdownExtensionsTest(TestCase):
         ):
             self.get_config(Schema, config)
 
-    @patch('markdown.Markdown')
-    def test_invalid_config_item(self, mock_md) -> None:
+    def test_invalid_config_item(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions()
 
@@ -1571,8 +1537,7 @@ class MarkdownExtensionsTest(TestCase):
         with self.expect_error(markdown_extensions="Invalid Markdown Extensions configuration"):
             self.get_config(Schema, config)
 
-    @patch('markdown.Markdown')
-    def test_invalid_dict_item(self, mock_md) -> None:
+    def test_invalid_dict_item(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions()
 
@@ -1584,6 +1549,62 @@ class MarkdownExtensionsTest(TestCase):
         with self.expect_error(markdown_extensions="Invalid Markdown Extensions configuration"):
             self.get_config(Schema, config)
 
+    def test_empty_dict_item(self) -> None:
+        class Schema(Config):
+            markdown_extensions = c.MarkdownExtensions()
+
+        with self.expect_error(markdown_extensions="Invalid Markdown Extensions configuration"):
+            self.get_config(Schema, {'markdown_extensions': [{}]})
+
+
+class MarkdownExtensionsLoadingTest(TestCase):
+    def test_duplicates(self) -> None:
+        class Schema(Config):
+            markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
+            mdx_configs = c.Private()
+
+        config = {
+            'markdown_extensions': ['meta', 'toc'],
+        }
+        conf = self.get_config(Schema, config)
+        self.assertEqual(conf.markdown_extensions, ['meta', 'toc'])
+        self.assertEqual(conf.mdx_configs, {})
+
+    def test_builtins_config(self) -> None:
+        class Schema(Config):
+            markdown_extensions = c.MarkdownExtensions(builtins=['meta', 'toc'])
+            mdx_configs = c.Private()
+
+        config = {
+            'markdown_extensions': [
+                {'toc': {'permalink': True}},
+            ],
+        }
+        conf = self.get_config(Schema, config)
+        self.assertEqual(conf.markdown_extensions, ['meta', 'toc'])
+        self.assertEqual(conf.mdx_configs, {'toc': {'permalink': True}})
+
+    def test_missing_default(self) -> None:
+        class Schema(Config):
+            markdown_extensions = c.MarkdownExtensions()
+            mdx_configs = c.Private()
+
+        conf = self.get_config(Schema, {})
+        self.assertEqual(conf.markdown_extensions, [])
+        self.assertEqual(conf.mdx_configs, {})
+
+    def test_none(self) -> None:
+        class Schema(Config):
+            markdown_extensions = c.MarkdownExtensions(default=[])
+            mdx_configs = c.Private()
+
+        config = {
+            'markdown_extensions': None,
+        }
+        conf = self.get_config(Schema, config)
+        self.assertEqual(conf.markdown_extensions, [])
+        self.assertEqual(conf.mdx_configs, {})
+
     def test_unknown_extension(self) -> None:
         class Schema(Config):
             markdown_extensions = c.MarkdownExtensions()
@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 
+import copy
 import datetime
+import json
 import logging
 import os
 import posixpath
+import re
 import stat
 import unittest
 from unittest import mock
 
+import yaml
+
 from mkdocs import exceptions, utils
 from mkdocs.structure.files import File
 from mkdocs.structure.pages import Page
@@ -37,6 +42,11 @@ deep1:
 
 
 class UtilsTests(unittest.TestCase):
+    def setUp(self):
+        # Some tests mock out the installed themes, so don't let them see or leave a cached scan.
+        utils._get_theme_entry_points.cache_clear()
+        self.addCleanup(utils._get_theme_entry_points.cache_clear)
+
     def test_is_markdown_file(self):
         expected_results = {
             'index.md': True,
@@ -306,6 +316,17 @@ class UtilsTests(unittest.TestCase):
         self.assertIn('mkdocs', themes)
         self.assertIn('readthedocs', themes)
 
+    @mock.patch('mkdocs.utils.entry_points', autospec=True)
+    def test_get_themes_scans_once(self, mock_iter):
+        theme = mock.Mock()
+        theme.name = 'mkdocs2'
+        theme.dist.name = 'mkdocs2'
+        mock_iter.return_value = [theme]
+
+        self.assertEqual(utils.get_themes(), {'mkdocs2': theme})
+        self.assertEqual(utils.get_themes(), {'mkdocs2': theme})
+        mock_iter.assert_called_once_with(group='mkdocs.themes')
+
     @mock.patch('mkdocs.utils.entry_points', autospec=True)
     def test_get_theme_dir(self, mock_iter):
         path = 'some/path'
@@ -468,6 +489,108 @@ class UtilsTests(unittest.TestCase):
             result = utils.yaml_load(fd)
         self.assertEqual(result, expected)
 
+    def test_yaml_load_global_constructor(self):
+        # Plugins may register tags on PyYAML's default loaders, without passing a `Loader`.
+        for cls in yaml.Loader, yaml.FullLoader, yaml.UnsafeLoader:
+            for attr in 'yaml_constructors', 'yaml_implicit_resolvers':
+                if attr in cls.__dict__:
+                    self.addCleanup(setattr, cls, attr, copy.deepcopy(cls.__dict__[attr]))
+                else:
+                    self.addCleanup(delattr, cls, attr)
+        yaml.add_constructor('!foo', lambda loader, node: 'FOO')
+        yaml.add_implicit_resolver('!foo', re.compile(r'^xfoo$'), ['x'])
+
+        self.assertEqual(utils.yaml_load('a: !foo x\nb: xfoo\n'), {'a': 'FOO', 'b': 'FOO'})
+
+    @tempdir(files={'mkdocs.yml': 'foo: bar\nbaz: [1, 2]\n'})
+    def test_yaml_load_cached(self, tdir):
+        path = os.path.join(tdir, 'mkdocs.yml')
+        with mock.patch('yaml.load', wraps=yaml.load) as mock_load:
+            with open(path, 'rb') as fd:
+                result = utils.yaml_load(fd)
+            self.assertEqual(result, {'foo': 'bar', 'baz': [1, 2]})
+            result['baz'].append(3)
+
+            with open(path, 'rb') as fd:
+                self.assertEqual(utils.yaml_load(fd), {'foo': 'bar', 'baz': [1, 2]})
+            self.assertEqual(mock_load.call_count, 1)
+
+            # Same size, so only the changed mtime tells the two versions apart.
+            mtime_ns = os.stat(path).st_mtime_ns
+            with open(path, 'w') as fd:
+                fd.write('foo: baz\nbaz: [1, 2]\n')
+            os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+            with open(path, 'rb') as fd:
+                self.assertEqual(utils.yaml_load(fd), {'foo': 'baz', 'baz': [1, 2]})
+            self.assertEqual(mock_load.call_count, 2)
+
+    @tempdir(files={'mkdocs.yml': 'foo: bar\n', 'new.yml': 'foo: baz\n'})
+    def test_yaml_load_cached_file_replaced(self, tdir):
+        path = os.path.join(tdir, 'mkdocs.yml')
+        with open(path, 'rb') as fd:
+            self.assertEqual(utils.yaml_load(fd), {'foo': 'bar'})
+
+        # Same path, size and mtime; only the inode differs.
+        new_path = os.path.join(tdir, 'new.yml')
+        st = os.stat(path)
+        os.utime(new_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(new_path, path)
+        with open(path, 'rb') as fd:
+            self.assertEqual(utils.yaml_load(fd), {'foo': 'baz'})
+
+    @tempdir(files={'mkdocs.yml': 'foo: bar\nbaz: qux\n'})
+    def test_yaml_load_partly_read_file_not_cached(self, tdir):
+        path = os.path.join(tdir, 'mkdocs.yml')
+        with open(path, 'rb') as fd:
+            self.assertEqual(utils.yaml_load(fd), {'foo': 'bar', 'baz': 'qux'})
+        with open(path, 'rb') as fd:
+            fd.readline()
+            self.assertEqual(utils.yaml_load(fd), {'baz': 'qux'})
+
+    @tempdir(files={'mkdocs.yml': 'nav: &n [*n]\nfoo: &f [1]\nbar: *f\n'})
+    def test_yaml_load_cached_aliases(self, tdir):
+        path = os.path.join(tdir, 'mkdocs.yml')
+        # Both when storing the first result in the cache and when copying it back out.
+        for _ in range(2):
+            with open(path, 'rb') as fd:
+                result = utils.yaml_load(fd)
+            self.assertIs(result['nav'][0], result['nav'])
+            self.assertEqual(result['foo'], [1])
+            self.assertIs(result['foo'], result['bar'])
+
+    @tempdir(
+        files={
+            'mkdocs.yml': 'mod: !!python/module:json\n' 'pid: !!python/object/apply:os.getpid []\n'
+        }
+    )
+    def test_yaml_load_python_tags_not_cached(self, tdir):
+        path = os.path.join(tdir, 'mkdocs.yml')
+        with mock.patch('yaml.load', wraps=yaml.load) as mock_load:
+            for _ in range(2):
+                with open(path, 'rb') as fd:
+                    self.assertEqual(utils.yaml_load(fd), {'mod': json, 'pid': os.getpid()})
+            self.assertEqual(mock_load.call_count, 2)
+
+    @unittest.skipUnless(os.path.isdir('/dev/fd'), "requires /dev/fd")
+    def test_yaml_load_pipe_not_cached(self):
+        read_fd, write_fd = os.pipe()
+        with open(write_fd, 'w') as w:
+            w.write('foo: bar\n')
+        try:
+            with open(f'/dev/fd/{read_fd}', 'rb') as fd:
+                self.assertIsNone(utils._yaml_cache_key(fd))
+                self.assertEqual(utils.yaml_load(fd), {'foo': 'bar'})
+        finally:
+            os.close(read_fd)
+
+    @tempdir(files={'mkdocs.yml': 'foo: !ENV [VARNAME, default]\n'})
+    def test_yaml_load_env_var_not_cached(self, tdir):
+        path = os.path.join(tdir, 'mkdocs.yml')
+        for value in 'first', 'second':
+            with mock.patch.dict(os.environ, {'VARNAME': value}):
+                with open(path, 'rb') as fd:
+                    self.assertEqual(utils.yaml_load(fd), {'foo': value})
+
     @tempdir(files={'base.yml': BASEYML})
     def test_yaml_inheritance_missing_parent(self, tdir):
         with open(os.path.join(tdir, 'base.yml')) as fd:
@@ -6,15 +6,17 @@ and structure of the site and pages in the site.
 """
 from __future__ import annotations
 
+import copy
 import functools
 import logging
 import os
 import posixpath
 import re
 import shutil
+import stat
 import sys
 import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timezone
 from pathlib import PurePath
 from typing import (
@@ -28,6 +30,7 @@ from typing import (
     Optional,
     Tuple,
     TypeVar,
+    Union,
 )
 from urllib.parse import urlsplit
 
@@ -40,6 +43,11 @@ import yaml
 from mergedeep import merge
 from yaml_env_tag import construct_env_tag
 
+try:
+    from yaml import CLoader as DefaultLoader
+except ImportError:  # pragma: no cover
+    from yaml import Loader as DefaultLoader  # type: ignore
+
 from mkdocs import exceptions
 
 if TYPE_CHECKING:
@@ -58,7 +66,7 @@ markdown_extensions = (
 )
 
 
-def get_yaml_loader(loader=yaml.Loader):
+def get_yaml_loader(loader=DefaultLoader):
     """Wrap PyYaml's loader so we can extend it to suit our needs."""
 
     class Loader(loader):
@@ -67,6 +75,23 @@ def get_yaml_loader(loader=yaml.Loader):
         global loader unaltered.
         """
 
+    if loader is DefaultLoader and DefaultLoader is not yaml.Loader:
+        # Calling `yaml.add_constructor()` and friends without a `Loader` registers only on the
+        # pure-Python loaders, never on `CLoader`. Carry those registrations over, so plugins that
+        # add tags this way keep working with the faster parser.
+        Loader.yaml_constructors = {**loader.yaml_constructors, **yaml.Loader.yaml_constructors}
+        Loader.yaml_multi_constructors = {
+            **loader.yaml_multi_constructors,
+            **yaml.Loader.yaml_multi_constructors,
+        }
+        Loader.yaml_implicit_resolvers = {
+            k: list(v)
+            for k, v in {
+                **loader.yaml_implicit_resolvers,
+                **yaml.Loader.yaml_implicit_resolvers,
+            }.items()
+        }
+
     # Attach Environment Variable constructor.
     # See https://github.com/waylan/pyyaml-env-tag
     Loader.add_constructor('!ENV', construct_env_tag)
@@ -74,20 +99,113 @@ def get_yaml_loader(loader=yaml.Loader):
     return Loader
 
 
-def yaml_load(source: IO, loader=None) -> Optional[Dict[str, Any]]:
+_YamlCacheKey = Tuple[str, int, int, int, int]
+
+# Parsed YAML files keyed by (absolute path, device, inode, mtime, size), most recently used last.
+_yaml_cache: OrderedDict[_YamlCacheKey, Any] = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
+# Only documents built purely from these tags are cached. Anything else (`!ENV`, the `python/*`
+# tags, timestamps, ...) may depend on more than the file's contents, run code while being
+# constructed, or produce objects that can't be copied.
+_PLAIN_YAML_TAGS = frozenset(
+    f'tag:yaml.org,2002:{name}' for name in ('null', 'bool', 'int', 'float', 'str', 'seq', 'map')
+)
+
+
+def _yaml_cache_key(source: Union[IO, str]) -> Optional[_YamlCacheKey]:
+    """
+    Return a key identifying the on-disk state of `source`, or None if it can't be cached: it isn't
+    a regular file, or has already been partly read.
+    """
+    if isinstance(source, str):
+        return None
+    try:
+        st = os.fstat(source.fileno())
+        if not stat.S_ISREG(st.st_mode) or source.tell() != 0:
+            return None
+        # The device and inode catch a file replaced at the same path with the same size and
+        # mtime (e.g. by `cp -p` or `rsync -t`).
+        return (os.path.abspath(source.name), st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    except (AttributeError, OSError, TypeError, ValueError):
+        return None
+
+
+def _copy_yaml(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    A faster `copy.deepcopy` for the plain dicts, lists and scalars that make up most YAML.
+
+    Like `deepcopy`, it keeps a memo of copied containers, so aliases that are shared or refer
+    back to themselves (`&a [*a]`) are preserved in the copy.
+    """
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    if memo is None:
+        memo = {}
+    elif id(value) in memo:
+        return memo[id(value)]
+    if type(value) is dict:
+        new_dict: Dict[Any, Any] = {}
+        memo[id(value)] = new_dict
+        for k, v in value.items():
+            new_dict[k] = _copy_yaml(v, memo)
+        return new_dict
+    if type(value) is list:
+        new_list: List[Any] = []
+        memo[id(value)] = new_list
+        new_list.extend(_copy_yaml(v, memo) for v in value)
+        return new_list
+    return copy.deepcopy(value)
+
+
+def _yaml_load_file(source: Union[IO, str], Loader) -> Any:
+    """
+    Parse a single YAML document, reusing the previous result if the file is unchanged on disk.
+
+    Only files parsed with the default loader are cached, and only if they consist of plain
+    mappings, sequences and scalars. A cached result is always copied, so callers are free to
+    modify it.
+    """
+    key = _yaml_cache_key(source) if Loader is None else None
+    if key is None:
+        return yaml.load(source, Loader=Loader or get_yaml_loader())
+    if key in _yaml_cache:
+        _yaml_cache.move_to_end(key)
+        return _copy_yaml(_yaml_cache[key])
+
+    is_plain = True
+
+    class CheckingLoader(get_yaml_loader()):  # type: ignore[misc]
+        def construct_object(self, node, deep=False):
+            nonlocal is_plain
+            if node.tag not in _PLAIN_YAML_TAGS:
+                is_plain = False
+            return super().construct_object(node, deep=deep)
+
+    result = yaml.load(source, Loader=CheckingLoader)
+    if is_plain:
+        _yaml_cache[key] = _copy_yaml(result)
+        if len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return result
+
+
+def yaml_load(source: Union[IO, str], loader=None) -> Optional[Dict[str, Any]]:
     """Return dict of source YAML file using loader, recursively deep merging inherited parent."""
-    Loader = loader or get_yaml_loader()
-    result = yaml.load(source, Loader=Loader)
+    result = _yaml_load_file(source, loader)
     if result is not None and 'INHERIT' in result:
         relpath = result.pop('INHERIT')
-        abspath = os.path.normpath(os.path.join(os.path.dirname(source.name), relpath))
+        # Only supported for files: a YAML string has no location to resolve the parent against.
+        abspath = os.path.normpath(
+            os.path.join(os.path.dirname(source.name), relpath)  # type: ignore[union-attr]
+        )
         if not os.path.exists(abspath):
             raise exceptions.ConfigurationError(
                 f"Inherited config file '{relpath}' does not exist at '{abspath}'."
             )
         log.debug(f"Loading inherited configuration file: {abspath}")
         with open(abspath, 'rb') as fd:
-            parent = yaml_load(fd, Loader)
+            parent = yaml_load(fd, loader)
         result = merge(parent, result)
     return result
 
@@ -338,11 +456,17 @@ def get_theme_dir(name: str) -> str:
     return os.path.dirname(os.path.abspath(theme.load().__file__))
 
 
+@functools.lru_cache(maxsize=None)
+def _get_theme_entry_points() -> Tuple[EntryPoint, ...]:
+    # Scanning the installed distributions is slow, and they don't change during a run.
+    return tuple(dict.fromkeys(entry_points(group='mkdocs.themes')))
+
+
 def get_themes() -> Dict[str, EntryPoint]:
     """Return a dict of all installed themes as {name: EntryPoint}."""
 
     themes: Dict[str, EntryPoint] = {}
-    eps: Dict[EntryPoint, None] = dict.fromkeys(entry_points(group='mkdocs.themes'))
+    eps = _get_theme_entry_points()
     builtins = {ep.name for ep in eps if ep.dist is not None and ep.dist.name == 'mkdocs'}
 
     for theme in eps: